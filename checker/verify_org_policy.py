@@ -7,6 +7,7 @@ Enforces, in the CURRENT working directory (target repo):
      - docs/MULTI_DOCUMENT_ENTERPRISE_CODING_PRINCIPLES_GUIDE.md
      - .github/policy/MULTI_DOCUMENT_ENTERPRISE_CODING_PRINCIPLES_GUIDE.md
      (Or a custom path via --guide)
+     The first non-empty regular file in that order is used.
   2) The guide must contain anchors exactly: "Principle 1:" .. "Principle 18:".
   3) Presence of a machine-readable compliance manifest at:
        policy/compliance.json
@@ -25,11 +26,21 @@ Exit codes:
 """
 from __future__ import annotations
 
-import argparse
-import json
+import errno
+import mmap
+import os
+import re
+import stat
 import sys
+from collections import OrderedDict
+from operator import is_, itemgetter
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Callable, Optional, TypeVar
+
+# argparse and json are imported lazily inside the helpers that use them, so
+# importing this module does not pay for them until they are actually needed.
+if TYPE_CHECKING:
+    import argparse
 
 # ----------------------------- Constants ------------------------------------ #
 
@@ -38,12 +49,30 @@ CANON_PATHS: tuple[str, ...] = (
     ".github/policy/MULTI_DOCUMENT_ENTERPRISE_CODING_PRINCIPLES_GUIDE.md",
 )
 COMPLIANCE_JSON = Path("policy/compliance.json")
-PRINCIPLES: tuple[str, ...] = tuple(f"Principle {i}:" for i in range(1, 19))
+_P_KEYS: tuple[str, ...] = tuple(f"P{i}" for i in range(1, 19))
+_GET_ALL = itemgetter(*_P_KEYS)
+_ALL_TRUE: tuple[bool, ...] = (True,) * 18
+_ANCHOR_RE = re.compile(rb"Principle (1[0-8]|[1-9]):")
+
+# Success output is fixed apart from the two paths; only those go through json.dumps.
+_SUCCESS_TMPL = '{{"ok": true, "guide": {g}, "manifest": {m}, "principles": "P1..P18"}}\n'
 
 EXIT_OK = 0
 EXIT_VIOLATION = 2
 EXIT_ERROR = 1
 
+# errnos that Path.exists() treats as "does not exist"; used for the manifest.
+_ABSENT_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.ELOOP, errno.EBADF})
+
+_T = TypeVar("_T")
+
+# Opt-in verdict caches for run(..., use_cache=True) in long-lived processes.
+# Keyed by absolute path; an entry is reused while (st_mtime_ns, st_size) match.
+# Each cache keeps at most _CACHE_MAXSIZE entries, evicting the least recently used.
+_CACHE_MAXSIZE = 16
+_GUIDE_CACHE: OrderedDict[str, tuple[tuple[int, int], list[str]]] = OrderedDict()
+_MANIFEST_CACHE: OrderedDict[str, tuple[tuple[int, int], Optional[str]]] = OrderedDict()
+
 
 # ----------------------------- Helpers -------------------------------------- #
 
@@ -59,21 +88,93 @@ def fail(msg: str, code: int = EXIT_VIOLATION) -> int:
     return code
 
 
-def _find_guide(custom: Optional[str]) -> Optional[Path]:
-    """Return the resolved guide path or None if not found."""
-    if custom:
-        p = Path(custom)
-        return p if (p.exists() and p.is_file() and p.stat().st_size > 0) else None
-    for p in CANON_PATHS:
-        pp = Path(p)
-        if pp.exists() and pp.is_file() and pp.stat().st_size > 0:
-            return pp
+def _report(as_json: bool, msg: str, code: int, **extra: str) -> int:
+    """Emit a failure as JSON on stdout or as text on stderr and return code."""
+    if as_json:
+        import json
+
+        print(json.dumps({"ok": False, "error": msg, "code": code, **extra}))
+        return code
+    if code == EXIT_ERROR:
+        _eprint(msg)
+        return code
+    return fail(msg, code)
+
+
+def _report_ok(guide_path: Path) -> int:
+    """Write the success result line to stdout and return EXIT_OK."""
+    import json
+
+    sys.stdout.write(
+        _SUCCESS_TMPL.format(g=json.dumps(str(guide_path)), m=json.dumps(str(COMPLIANCE_JSON)))
+    )
+    return EXIT_OK
+
+
+def _find_guide(custom: Optional[str]) -> Optional[tuple[Path, os.stat_result]]:
+    """Return the resolved guide path and its stat result, or None if not found."""
+    for p in (custom,) if custom else CANON_PATHS:
+        # One stat(2) per candidate instead of exists()/is_file()/stat().
+        try:
+            st = os.stat(p)
+        except (OSError, ValueError):  # missing, ELOOP, embedded NUL, ... (as Path.exists())
+            continue
+        # An empty canonical guide falls through to the next path; an explicit
+        # --guide only has to be a regular file (emptiness fails the anchor scan).
+        if stat.S_ISREG(st.st_mode) and (custom or st.st_size > 0):
+            return Path(p), st
     return None
 
 
-def _missing_anchors(text: str, anchors: Iterable[str]) -> list[str]:
-    """Return the list of anchors missing from text."""
-    return [a for a in anchors if a not in text]
+def _cached(
+    cache: OrderedDict[str, tuple[tuple[int, int], _T]],
+    path: Path,
+    st: os.stat_result,
+    compute: Callable[[], _T],
+) -> _T:
+    """Return compute() for path, reusing the cached value while its stat signature holds."""
+    key = os.path.abspath(path)
+    sig = (st.st_mtime_ns, st.st_size)
+    hit = cache.get(key)
+    if hit is not None and hit[0] == sig:
+        cache.move_to_end(key)
+        return hit[1]
+    value = compute()
+    cache[key] = (sig, value)
+    cache.move_to_end(key)
+    if len(cache) > _CACHE_MAXSIZE:
+        cache.popitem(last=False)
+    return value
+
+
+def _missing_anchors(data: bytes | mmap.mmap) -> list[str]:
+    """Return the "Principle N:" anchors missing from data, stopping once all are seen."""
+    found: set[int] = set()
+    for m in _ANCHOR_RE.finditer(data):
+        found.add(int(m.group(1)))
+        if len(found) == 18:  # all present: skip the rest of the guide
+            return []
+    return [f"Principle {i}:" for i in range(1, 19) if i not in found]
+
+
+def _scan_guide(path: Path) -> list[str]:
+    """Memory-map the guide and return its missing anchors (no str decode)."""
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return _missing_anchors(f.read())
+        with mm:
+            return _missing_anchors(mm)
+
+
+def _check_manifest() -> Optional[str]:
+    """Parse and validate COMPLIANCE_JSON; raises on unreadable or malformed JSON."""
+    import json
+
+    # Strict UTF-8, as before: handing raw bytes to json.loads would also accept
+    # UTF-16/32 and a UTF-8 BOM.
+    return _validate_manifest_schema(json.loads(COMPLIANCE_JSON.read_bytes().decode("utf-8")))
 
 
 def _validate_manifest_schema(obj: object) -> Optional[str]:
@@ -97,13 +198,15 @@ def _validate_manifest_schema(obj: object) -> Optional[str]:
     if not isinstance(principles, dict):
         return "compliance.json.principles must be an object"
 
-    # Ensure all P1..P18 exist and are True
-    missing = [f"P{i}" for i in range(1, 19) if f"P{i}" not in principles]
-    if missing:
+    # Ensure all P1..P18 exist and are True: one C-level fetch and identity check;
+    # the per-key lists are only built on failure, for the message.
+    try:
+        values = _GET_ALL(principles)
+    except KeyError:
+        missing = [k for k in _P_KEYS if k not in principles]
         return f"compliance.principles missing keys: {', '.join(missing)}"
-
-    not_true = [k for k in (f"P{i}" for i in range(1, 19)) if principles.get(k) is not True]
-    if not_true:
+    if not all(map(is_, values, _ALL_TRUE)):  # `is True`, so 1 / 1.0 do not pass
+        not_true = [k for k in _P_KEYS if principles[k] is not True]
         return f"non-compliant principles (must be true): {', '.join(not_true)}"
 
     return None
@@ -112,99 +215,99 @@ def _validate_manifest_schema(obj: object) -> Optional[str]:
 # ------------------------------ Main ---------------------------------------- #
 
 
-def run(argv: Optional[list[str]] = None) -> int:
-    parser = argparse.ArgumentParser(
-        description="Verify presence and completeness of the enterprise coding principles guide "
-        "and compliance manifest."
-    )
-    parser.add_argument(
-        "--guide",
-        help="Optional explicit path to MULTI_DOCUMENT_ENTERPRISE_CODING_PRINCIPLES_GUIDE.md",
-    )
-    parser.add_argument(
-        "--json",
-        action="store_true",
-        help="Emit a machine-readable JSON result on success or failure.",
-    )
-    args = parser.parse_args(argv)
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser on first use and reuse it for later run() calls."""
+    global _PARSER
+    if _PARSER is None:
+        import argparse
+
+        parser = argparse.ArgumentParser(
+            description="Verify presence and completeness of the enterprise coding principles guide "
+            "and compliance manifest."
+        )
+        parser.add_argument(
+            "--guide",
+            help="Optional explicit path to MULTI_DOCUMENT_ENTERPRISE_CODING_PRINCIPLES_GUIDE.md",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Emit a machine-readable JSON result on success or failure.",
+        )
+        _PARSER = parser
+    return _PARSER
+
+
+def run(argv: Optional[list[str]] = None, *, use_cache: bool = False) -> int:
+    """
+    Run the checker against the current working directory.
+
+    With use_cache=True, anchor-scan and manifest verdicts are memoized per
+    absolute path and reused until the file's mtime or size changes, so
+    repeated calls cost one stat per file instead of a read and parse. Each
+    cache holds at most _CACHE_MAXSIZE paths (least recently used evicted).
+    """
+    args = _get_parser().parse_args(argv)
 
     # 1) Guide presence (with optional override)
-    guide_path = _find_guide(args.guide)
-    if not guide_path:
+    found = _find_guide(args.guide)
+    if not found:
         msg = (
             f"Guide not found. Checked: "
             f"{(args.guide or 'N/A (no --guide)')}, "
             f"{', '.join(CANON_PATHS)}; "
             f"files must exist and be non-empty."
         )
-        if args.json:
-            print(json.dumps({"ok": False, "error": msg, "code": EXIT_VIOLATION}))
-            return EXIT_VIOLATION
-        return fail(msg, EXIT_VIOLATION)
+        return _report(args.json, msg, EXIT_VIOLATION)
+    guide_path, guide_st = found
 
     # 2) Anchors P1..P18
     try:
-        text = guide_path.read_text(encoding="utf-8", errors="strict")
-    except Exception as exc:  # unexpected I/O
+        if use_cache:
+            missing = _cached(_GUIDE_CACHE, guide_path, guide_st, lambda: _scan_guide(guide_path))
+        else:
+            missing = _scan_guide(guide_path)
+    except OSError as exc:  # unexpected I/O
         msg = f"Failed to read guide '{guide_path}': {exc!s}"
-        if args.json:
-            print(json.dumps({"ok": False, "error": msg, "code": EXIT_ERROR}))
-            return EXIT_ERROR
-        _eprint(msg)
-        return EXIT_ERROR
+        return _report(args.json, msg, EXIT_ERROR)
 
-    missing = _missing_anchors(text, PRINCIPLES)
     if missing:
         msg = f"Guide missing required anchors: {', '.join(missing)}"
-        if args.json:
-            print(json.dumps({"ok": False, "error": msg, "code": EXIT_VIOLATION, "guide": str(guide_path)}))
-            return EXIT_VIOLATION
-        return fail(msg, EXIT_VIOLATION)
-
-    # 3) compliance manifest
-    if not COMPLIANCE_JSON.exists():
-        msg = f"Missing compliance manifest: {COMPLIANCE_JSON}"
-        if args.json:
-            print(json.dumps({"ok": False, "error": msg, "code": EXIT_VIOLATION, "guide": str(guide_path)}))
-            return EXIT_VIOLATION
-        return fail(msg, EXIT_VIOLATION)
+        return _report(args.json, msg, EXIT_VIOLATION, guide=str(guide_path))
 
+    # 3) compliance manifest (EAFP: a missing file surfaces from the stat/read itself)
     try:
-        manifest_obj = json.loads(COMPLIANCE_JSON.read_text(encoding="utf-8"))
-    except Exception as exc:
+        if use_cache:
+            schema_err = _cached(
+                _MANIFEST_CACHE, COMPLIANCE_JSON, os.stat(COMPLIANCE_JSON), _check_manifest
+            )
+        else:
+            schema_err = _check_manifest()
+    except OSError as exc:
+        if exc.errno in _ABSENT_ERRNOS:
+            msg = f"Missing compliance manifest: {COMPLIANCE_JSON}"
+            return _report(args.json, msg, EXIT_VIOLATION, guide=str(guide_path))
+        # unexpected I/O
+        msg = f"Failed to read compliance manifest '{COMPLIANCE_JSON}': {exc!s}"
+        return _report(args.json, msg, EXIT_ERROR, manifest=str(COMPLIANCE_JSON))
+    except (ValueError, RecursionError) as exc:  # JSONDecodeError, UnicodeDecodeError, deep nesting
         msg = f"Malformed compliance.json (invalid JSON): {exc!s}"
-        if args.json:
-            print(json.dumps({"ok": False, "error": msg, "code": EXIT_ERROR, "manifest": str(COMPLIANCE_JSON)}))
-            return EXIT_ERROR
-        _eprint(msg)
-        return EXIT_ERROR
+        return _report(args.json, msg, EXIT_ERROR, manifest=str(COMPLIANCE_JSON))
 
-    schema_err = _validate_manifest_schema(manifest_obj)
     if schema_err:
-        if args.json:
-            print(
-                json.dumps(
-                    {
-                        "ok": False,
-                        "error": schema_err,
-                        "code": EXIT_VIOLATION,
-                        "manifest": str(COMPLIANCE_JSON),
-                        "guide": str(guide_path),
-                    }
-                )
-            )
-            return EXIT_VIOLATION
-        return fail(schema_err, EXIT_VIOLATION)
+        return _report(
+            args.json,
+            schema_err,
+            EXIT_VIOLATION,
+            manifest=str(COMPLIANCE_JSON),
+            guide=str(guide_path),
+        )
 
     # Success
-    result = {
-        "ok": True,
-        "guide": str(guide_path),
-        "manifest": str(COMPLIANCE_JSON),
-        "principles": "P1..P18",
-    }
-    print(json.dumps(result))
-    return EXIT_OK
+    return _report_ok(guide_path)
 
 
 def main() -> None:
@@ -0,0 +1,71 @@
+"""Tests for the opt-in verdict cache of run(..., use_cache=True)."""
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from checker import verify_org_policy as vop
+
+GUIDE = Path(__file__).resolve().parents[1] / "docs" / "MULTI_DOCUMENT_ENTERPRISE_CODING_PRINCIPLES_GUIDE.md"
+
+
+def _write_manifest(path: Path, **overrides: bool) -> None:
+    principles = {f"P{i}": True for i in range(1, 19)}
+    principles.update(overrides)
+    path.write_text(json.dumps({"project": "x", "run_id": "1", "principles": principles}))
+
+
+class RunCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._old_cwd = os.getcwd()
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        (self.tmp / "docs").mkdir()
+        shutil.copy(GUIDE, self.tmp / "docs" / GUIDE.name)
+        (self.tmp / "policy").mkdir()
+        self.manifest = self.tmp / "policy" / "compliance.json"
+        _write_manifest(self.manifest)
+        os.chdir(self.tmp)
+        self.addCleanup(os.chdir, self._old_cwd)
+        vop._GUIDE_CACHE.clear()
+        vop._MANIFEST_CACHE.clear()
+
+    def _run(self) -> int:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            return vop.run([], use_cache=True)
+
+    def test_rewrite_invalidates_cached_verdict(self) -> None:
+        self.assertEqual(self._run(), vop.EXIT_OK)
+        st = os.stat(self.manifest)
+
+        _write_manifest(self.manifest, P3=False)
+        # Force a different signature even on coarse-mtime filesystems.
+        os.utime(self.manifest, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(self._run(), vop.EXIT_VIOLATION)
+
+    def test_unchanged_file_reuses_cached_verdict(self) -> None:
+        self.assertEqual(self._run(), vop.EXIT_OK)
+        calls = []
+        orig = vop._check_manifest
+        vop._check_manifest = lambda: calls.append(1) or orig()
+        self.addCleanup(setattr, vop, "_check_manifest", orig)
+        self.assertEqual(self._run(), vop.EXIT_OK)
+        self.assertEqual(calls, [])
+
+    def test_cache_is_bounded(self) -> None:
+        for i in range(vop._CACHE_MAXSIZE + 4):
+            p = self.tmp / f"{i}.json"
+            p.write_text("{}")
+            vop._cached(vop._MANIFEST_CACHE, p, os.stat(p), lambda: None)
+        self.assertEqual(len(vop._MANIFEST_CACHE), vop._CACHE_MAXSIZE)
+        self.assertNotIn(str(self.tmp / "0.json"), vop._MANIFEST_CACHE)
+
+
+if __name__ == "__main__":
+    unittest.main()